@@ -1,16 +1,34 @@
 """Streamlit 웹 챗봇 엔트리 포인트"""
 import streamlit as st
 import os
+import time
+import uuid
 #from dotenv import load_dotenv
 
 from src.llm import LLMClient
 from src.prompts import DEFAULT_SYSTEM_PROMPT, DEFAULT_MODEL, DEFAULT_TEMPERATURE
-from src.ui import render_sidebar, render_chat_history, render_streaming_message
+from src.profiling import (
+    begin_rerun,
+    configure as configure_profiling,
+    is_configured as profiling_configured,
+    is_enabled as profiling_enabled,
+    span,
+)
+from src.ui import render_sidebar, render_chat_history, render_streaming_message, render_profiling_panel
 from src.utils import format_error_message, get_env_var, setup_logging
 
 # 로깅 설정
 setup_logging()
 
+# 프로파일링 설정 (CHATBOT_PROFILING=1 일 때만 구간 기록, 프로세스당 한 번만 조회)
+if not profiling_configured():
+    configure_profiling(get_env_var("CHATBOT_PROFILING"))
+
+# 세션별로 구간을 구분하기 위한 rerun 시작 표시
+if "profiling_session_id" not in st.session_state:
+    st.session_state.profiling_session_id = uuid.uuid4().hex
+rerun_id = begin_rerun(st.session_state.profiling_session_id)
+
 # 환경변수 로드
 #load_dotenv()
 
@@ -125,103 +143,128 @@ def main():
             st.caption(f"📏 길이: {len(api_key_clean)} 문자")
     
     # 채팅 히스토리 렌더링
-    render_chat_history(st.session_state.messages)
+    with span("render_chat_history", messages=len(st.session_state.messages)):
+        render_chat_history(st.session_state.messages)
     
     # 사용자 입력 처리
     user_input = st.chat_input("메시지를 입력하세요...")
     
     if user_input:
-        # 사용자 메시지를 세션에 추가하고 즉시 표시
-        st.session_state.messages.append({
-            "role": "user",
-            "content": user_input
-        })
-        
-        # 사용자 메시지 렌더링
-        with st.chat_message("user"):
-            st.markdown(user_input)
-        
-        # 어시스턴트 응답 생성 (스트리밍)
-        try:
-            # LLM 클라이언트 초기화 (API 키 재확인)
-            try:
-                llm_client = LLMClient()
-            except ValueError as ve:
-                st.error(f"❌ API 키 설정 오류: {str(ve)}")
-                with st.expander("🔍 API 키 확인 방법"):
-                    st.write("""
-                    1. **.env 파일 확인**
-                       - 프로젝트 루트 디렉토리에 `.env` 파일이 있는지 확인하세요
-                       - 파일 내용: `OPENAI_API_KEY=sk-proj-...` (공백 없이)
-                    
-                    2. **API 키 형식 확인**
-                       - `sk-proj-` 또는 `sk-`로 시작해야 합니다
-                       - 전체 키를 복사했는지 확인하세요 (일부만 복사되지 않았는지)
-                       - 따옴표나 공백이 없어야 합니다
-                    
-                    3. **파일 저장 확인**
-                       - .env 파일을 저장했는지 확인하세요
-                       - Streamlit 앱을 재시작하세요 (환경변수는 앱 시작 시 로드됩니다)
-                    
-                    4. **API 키 확인**
-                       - https://platform.openai.com/account/api-keys 에서 확인하세요
-                    """)
-                return
-            
-            # 메시지 포맷 준비 (system + history)
-            messages_for_api = [
-                {"role": "system", "content": st.session_state.system_prompt}
-            ]
-            # user/assistant 메시지만 추가 (system 제외)
-            for msg in st.session_state.messages:
-                messages_for_api.append({
-                    "role": msg["role"],
-                    "content": msg["content"]
-                })
+        with span("turn", messages=len(st.session_state.messages) + 1):
+            # 사용자 메시지를 세션에 추가하고 즉시 표시
+            st.session_state.messages.append({
+                "role": "user",
+                "content": user_input
+            })
             
-            # 스트리밍 응답 생성
-            assistant_placeholder = render_streaming_message("assistant")
-            full_response = ""
+            # 사용자 메시지 렌더링
+            with st.chat_message("user"):
+                st.markdown(user_input)
             
-            with st.spinner("답변을 생성하는 중..."):
+            # 어시스턴트 응답 생성 (스트리밍)
+            try:
+                # LLM 클라이언트 초기화 (API 키 재확인)
                 try:
-                    for chunk in llm_client.stream_chat(
-                        messages=messages_for_api,
-                        model=st.session_state.model,
-                        temperature=st.session_state.temperature,
-                    ):
-                        full_response += chunk
-                        assistant_placeholder.markdown(full_response + "▌")
-                    
-                    # 최종 응답 표시 (커서 제거)
-                    assistant_placeholder.markdown(full_response)
-                    
-                    # 어시스턴트 메시지를 세션에 추가
-                    st.session_state.messages.append({
-                        "role": "assistant",
-                        "content": full_response
-                    })
-                    
-                except Exception as e:
-                    # 예외 메시지를 그대로 표시 (이미 포맷된 경우)
-                    error_msg = str(e)
-                    assistant_placeholder.error(f"❌ 오류 발생")
-                    # 상세 에러 메시지를 expander로 표시
-                    with st.expander("🔍 상세 에러 정보", expanded=True):
+                    llm_client = LLMClient()
+                except ValueError as ve:
+                    st.error(f"❌ API 키 설정 오류: {str(ve)}")
+                    with st.expander("🔍 API 키 확인 방법"):
+                        st.write("""
+                        1. **.env 파일 확인**
+                           - 프로젝트 루트 디렉토리에 `.env` 파일이 있는지 확인하세요
+                           - 파일 내용: `OPENAI_API_KEY=sk-proj-...` (공백 없이)
+                        
+                        2. **API 키 형식 확인**
+                           - `sk-proj-` 또는 `sk-`로 시작해야 합니다
+                           - 전체 키를 복사했는지 확인하세요 (일부만 복사되지 않았는지)
+                           - 따옴표나 공백이 없어야 합니다
+                        
+                        3. **파일 저장 확인**
+                           - .env 파일을 저장했는지 확인하세요
+                           - Streamlit 앱을 재시작하세요 (환경변수는 앱 시작 시 로드됩니다)
+                        
+                        4. **API 키 확인**
+                           - https://platform.openai.com/account/api-keys 에서 확인하세요
+                        """)
+                    return
+                
+                # 메시지 포맷 준비 (system + history)
+                with span("build_messages_for_api", messages=len(st.session_state.messages)):
+                    messages_for_api = [
+                        {"role": "system", "content": st.session_state.system_prompt}
+                    ]
+                    # user/assistant 메시지만 추가 (system 제외)
+                    for msg in st.session_state.messages:
+                        messages_for_api.append({
+                            "role": msg["role"],
+                            "content": msg["content"]
+                        })
+                
+                # 스트리밍 응답 생성
+                assistant_placeholder = render_streaming_message("assistant")
+                full_response = ""
+                stream_started = time.perf_counter()
+                
+                with st.spinner("답변을 생성하는 중..."):
+                    try:
+                        with span("stream_render_loop") as loop_span:
+                            chunk_count = 0
+                            render_ns = 0
+                            for chunk in llm_client.stream_chat(
+                                messages=messages_for_api,
+                                model=st.session_state.model,
+                                temperature=st.session_state.temperature,
+                            ):
+                                if chunk_count == 0:
+                                    loop_span.set(first_chunk_ms=round((time.perf_counter() - stream_started) * 1000, 1))
+                                chunk_count += 1
+                                full_response += chunk
+                                render_started = time.perf_counter_ns()
+                                assistant_placeholder.markdown(full_response + "▌")
+                                render_ns += time.perf_counter_ns() - render_started
+                            
+                            # 최종 응답 표시 (커서 제거)
+                            render_started = time.perf_counter_ns()
+                            assistant_placeholder.markdown(full_response)
+                            render_ns += time.perf_counter_ns() - render_started
+                            loop_span.set(
+                                chunks=chunk_count,
+                                chars=len(full_response),
+                                render_ms=round(render_ns / 1_000_000, 1),
+                            )
+                        
+                        # 어시스턴트 메시지를 세션에 추가
+                        st.session_state.messages.append({
+                            "role": "assistant",
+                            "content": full_response
+                        })
+                        
+                    except Exception as e:
+                        # 예외 메시지를 그대로 표시 (이미 포맷된 경우)
+                        error_msg = str(e)
+                        assistant_placeholder.error(f"❌ 오류 발생")
+                        # 상세 에러 메시지를 expander로 표시
+                        with st.expander("🔍 상세 에러 정보", expanded=True):
+                            st.error(error_msg)
                         st.error(error_msg)
+                        
+            except ValueError as e:
+                st.error(f"❌ 설정 오류: {str(e)}")
+                with st.expander("🔍 상세 정보", expanded=True):
+                    st.code(str(e), language="text")
+            except Exception as e:
+                error_msg = str(e)
+                st.error(f"❌ 예상치 못한 오류 발생")
+                with st.expander("🔍 상세 에러 정보", expanded=True):
                     st.error(error_msg)
-                    
-        except ValueError as e:
-            st.error(f"❌ 설정 오류: {str(e)}")
-            with st.expander("🔍 상세 정보", expanded=True):
-                st.code(str(e), language="text")
-        except Exception as e:
-            error_msg = str(e)
-            st.error(f"❌ 예상치 못한 오류 발생")
-            with st.expander("🔍 상세 에러 정보", expanded=True):
-                st.error(error_msg)
-                st.code(f"에러 타입: {type(e).__name__}\n에러 메시지: {error_msg}", language="text")
+                    st.code(f"에러 타입: {type(e).__name__}\n에러 메시지: {error_msg}", language="text")
 
 
 if __name__ == "__main__":
-    main()
+    with span("rerun"):
+        main()
+    
+    # 프로파일링 디버그 패널 (opt-in)
+    if profiling_enabled():
+        with span("render_profiling_panel"):
+            render_profiling_panel(rerun_id, st.session_state.profiling_session_id)
@@ -1,9 +1,11 @@
 """OpenAI LLM 호출 및 스트리밍 처리 모듈"""
 import os
+import time
 from typing import Iterator, Optional
 from openai import OpenAI
 from openai import APIError, APIConnectionError, APITimeoutError, RateLimitError
 
+from src.profiling import span
 from src.utils import format_error_message, get_env_var
 
 
@@ -58,16 +60,29 @@ class LLMClient:
             Exception: API 호출 실패 시
         """
         try:
-            stream = self.client.chat.completions.create(
-                model=model,
-                messages=messages,
-                temperature=temperature,
-                stream=True,
-            )
-            
-            for chunk in stream:
-                if chunk.choices[0].delta.content is not None:
-                    yield chunk.choices[0].delta.content
+            with span("LLMClient.stream_chat", model=model, messages=len(messages)) as stream_span:
+                with span("openai.chat.completions.create"):
+                    stream = self.client.chat.completions.create(
+                        model=model,
+                        messages=messages,
+                        temperature=temperature,
+                        stream=True,
+                    )
+                
+                # yield 사이(호출 측 렌더링) 시간은 빼고 다음 청크를 기다린 시간만 합산
+                network_wait_ns = 0
+                chunk_iter = iter(stream)
+                try:
+                    while True:
+                        wait_started = time.perf_counter_ns()
+                        chunk = next(chunk_iter, None)
+                        network_wait_ns += time.perf_counter_ns() - wait_started
+                        if chunk is None:
+                            break
+                        if chunk.choices[0].delta.content is not None:
+                            yield chunk.choices[0].delta.content
+                finally:
+                    stream_span.set(network_wait_ms=round(network_wait_ns / 1_000_000, 1))
                     
         except RateLimitError as e:
             error_detail = f"{e.message}" if hasattr(e, 'message') else str(e)
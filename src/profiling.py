@@ -0,0 +1,227 @@
+"""경량 구간(span) 프로파일링 모듈
+
+rerun/턴 단위로 주요 구간의 소요 시간을 링 버퍼에 기록하고,
+Chrome trace JSON(chrome://tracing, Perfetto)으로 내보낸다.
+비활성화 상태에서는 플래그 확인 한 번만 수행하므로 오버헤드가 거의 없다.
+"""
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, Callable, Optional
+
+# 링 버퍼에 보관할 최대 span 개수
+DEFAULT_BUFFER_SIZE = 2000
+
+_TRUTHY = ("1", "true", "yes", "on")
+
+_enabled = False
+_configured = False
+_spans: deque = deque(maxlen=DEFAULT_BUFFER_SIZE)
+_spans_lock = threading.Lock()
+_rerun_counter = itertools.count(1)
+# Streamlit은 세션(탭)마다 별도 스레드에서 스크립트를 실행하므로
+# 현재 rerun/세션 정보는 스레드 로컬에 보관한다.
+_local = threading.local()
+
+
+@dataclass
+class Span:
+    """기록된 구간 하나"""
+    name: str
+    start_ns: int
+    duration_ns: int
+    thread_id: int
+    depth: int
+    rerun_id: int
+    session_id: Optional[str]
+    args: dict = field(default_factory=dict)
+
+    @property
+    def duration_ms(self) -> float:
+        return self.duration_ns / 1_000_000
+
+
+class _ActiveSpan:
+    """활성화 상태에서 사용하는 span 컨텍스트 매니저"""
+    __slots__ = ("name", "args", "_start_ns", "_depth", "_rerun_id", "_session_id")
+
+    def __init__(self, name: str, args: dict):
+        self.name = name
+        self.args = args
+
+    def set(self, **args: Any) -> None:
+        """span에 인자(청크 수 등)를 추가"""
+        self.args.update(args)
+
+    def __enter__(self) -> "_ActiveSpan":
+        self._depth = getattr(_local, "depth", 0)
+        _local.depth = self._depth + 1
+        self._rerun_id = getattr(_local, "rerun_id", 0)
+        self._session_id = getattr(_local, "session_id", None)
+        self._start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        end_ns = time.perf_counter_ns()
+        _local.depth = self._depth
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        record = Span(
+            name=self.name,
+            start_ns=self._start_ns,
+            duration_ns=end_ns - self._start_ns,
+            thread_id=threading.get_ident(),
+            depth=self._depth,
+            rerun_id=self._rerun_id,
+            session_id=self._session_id,
+            args=self.args,
+        )
+        with _spans_lock:
+            _spans.append(record)
+
+
+class _NullSpan:
+    """비활성화 상태에서 사용하는 no-op span (싱글턴)"""
+    __slots__ = ()
+
+    def set(self, **args: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def is_enabled() -> bool:
+    """프로파일링 활성화 여부"""
+    return _enabled
+
+
+def is_configured() -> bool:
+    """configure()가 이미 호출되었는지 여부 (프로세스당 한 번만 설정하기 위함)"""
+    return _configured
+
+
+def configure(enabled: Optional[str | bool], buffer_size: Optional[int] = None) -> None:
+    """
+    프로파일링 설정
+
+    Args:
+        enabled: 활성화 여부 (bool 또는 "1"/"true"/"yes"/"on" 같은 환경변수 문자열)
+        buffer_size: 링 버퍼 크기 (지정 시 기존 기록은 최신 순으로 유지)
+    """
+    global _enabled, _configured, _spans
+    if isinstance(enabled, str):
+        enabled = enabled.strip().lower() in _TRUTHY
+    _enabled = bool(enabled)
+    _configured = True
+    if buffer_size is not None and buffer_size != _spans.maxlen:
+        with _spans_lock:
+            _spans = deque(_spans, maxlen=buffer_size)
+
+
+def span(name: str, **args: Any):
+    """
+    구간 측정용 컨텍스트 매니저 반환
+
+    Example:
+        with span("render_chat_history", messages=len(messages)):
+            ...
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return _ActiveSpan(name, args)
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """함수 호출 전체를 span으로 감싸는 데코레이터"""
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _ActiveSpan(span_name, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def begin_rerun(session_id: Optional[str] = None) -> int:
+    """
+    현재 스레드에서 새 Streamlit rerun 시작을 표시하고 rerun 번호를 반환
+
+    Args:
+        session_id: 브라우저 세션 식별자 (세션별 조회/초기화에 사용)
+    """
+    _local.rerun_id = next(_rerun_counter)
+    _local.session_id = session_id
+    return _local.rerun_id
+
+
+def get_spans(rerun_id: Optional[int] = None, session_id: Optional[str] = None) -> list[Span]:
+    """
+    링 버퍼의 span 목록 반환 (시작 시각 순)
+
+    Args:
+        rerun_id: 지정 시 해당 rerun의 span만 반환
+        session_id: 지정 시 해당 세션의 span만 반환
+    """
+    with _spans_lock:
+        spans = list(_spans)
+    if rerun_id is not None:
+        spans = [s for s in spans if s.rerun_id == rerun_id]
+    if session_id is not None:
+        spans = [s for s in spans if s.session_id == session_id]
+    return sorted(spans, key=lambda s: s.start_ns)
+
+
+def clear(session_id: Optional[str] = None) -> None:
+    """
+    기록된 span 삭제
+
+    Args:
+        session_id: 지정 시 해당 세션의 span만 삭제 (미지정 시 전체 삭제)
+    """
+    with _spans_lock:
+        if session_id is None:
+            _spans.clear()
+            return
+        kept = [s for s in _spans if s.session_id != session_id]
+        _spans.clear()
+        _spans.extend(kept)
+
+
+def export_chrome_trace(spans: Optional[list[Span]] = None) -> str:
+    """
+    span 목록을 Chrome trace JSON 문자열로 변환
+
+    chrome://tracing 또는 https://ui.perfetto.dev 에서 열 수 있다.
+    """
+    if spans is None:
+        spans = get_spans()
+    pid = os.getpid()
+    events = []
+    for s in spans:
+        events.append({
+            "name": s.name,
+            "cat": "chatbot",
+            "ph": "X",
+            "ts": s.start_ns / 1000,
+            "dur": s.duration_ns / 1000,
+            "pid": pid,
+            "tid": s.thread_id,
+            "args": {"rerun": s.rerun_id, "session": s.session_id, **s.args},
+        })
+    return json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}, ensure_ascii=False, default=str)
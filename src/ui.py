@@ -2,6 +2,8 @@
 import streamlit as st
 from typing import Optional
 
+from src.profiling import clear, export_chrome_trace, get_spans
+
 
 def render_sidebar(
     default_model: str,
@@ -97,3 +99,55 @@ def render_streaming_message(role: str = "assistant"):
         streamlit.delta_generator.DeltaGenerator: placeholder 객체
     """
     return st.chat_message(role).empty()
+
+
+def render_profiling_panel(rerun_id: int, session_id: str):
+    """
+    프로파일링 디버그 패널 렌더링 (CHATBOT_PROFILING 활성화 시에만 호출)
+    
+    Args:
+        rerun_id: 표시할 rerun 번호
+        session_id: 현재 브라우저 세션 식별자 (내보내기/초기화 범위)
+    """
+    spans = get_spans(rerun_id, session_id)
+    
+    with st.expander("⏱️ 프로파일링 (디버그)"):
+        if not spans:
+            st.caption("기록된 구간이 없습니다.")
+        else:
+            total_ms = max((s.duration_ms for s in spans if s.depth == 0), default=0.0)
+            st.caption(f"rerun #{rerun_id} · {len(spans)}개 구간 · 최상위 구간 {total_ms:.1f} ms")
+            st.dataframe(
+                [
+                    {
+                        "구간": "· " * s.depth + s.name,
+                        "깊이": s.depth,
+                        "소요 시간 (ms)": round(s.duration_ms, 2),
+                        "인자": ", ".join(f"{k}={v}" for k, v in s.args.items()),
+                    }
+                    for s in spans
+                ],
+                use_container_width=True,
+                hide_index=True,
+            )
+        
+        col_download, col_clear = st.columns(2)
+        with col_download:
+            # trace JSON은 요청했을 때만 생성 (매 rerun마다 버퍼 전체를 직렬화하지 않도록)
+            # 다운로드 클릭으로 인한 rerun 이후에도 버튼이 유지되도록 세션 상태에 보관
+            if st.button("📦 Chrome trace 준비", use_container_width=True, help="현재 세션의 버퍼 기록으로 trace를 다시 생성합니다."):
+                st.session_state.profiling_trace = export_chrome_trace(get_spans(session_id=session_id))
+            if "profiling_trace" in st.session_state:
+                st.download_button(
+                    "📥 Chrome trace 내보내기",
+                    data=st.session_state.profiling_trace,
+                    file_name="chatbot_trace.json",
+                    mime="application/json",
+                    help="chrome://tracing 또는 ui.perfetto.dev 에서 열 수 있습니다. (준비 시점의 현재 세션 기록)",
+                    use_container_width=True,
+                )
+        with col_clear:
+            if st.button("🧹 기록 초기화", use_container_width=True, help="현재 세션의 기록만 삭제합니다."):
+                clear(session_id)
+                st.session_state.pop("profiling_trace", None)
+                st.rerun()
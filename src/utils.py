@@ -2,6 +2,8 @@
 import logging
 from typing import Optional
 
+from src.profiling import traced
+
 
 def setup_logging(level: int = logging.INFO) -> None:
     """로깅 설정"""
@@ -42,6 +44,7 @@ def format_error_message(error: Exception) -> str:
     return f"❌ 오류가 발생했습니다: {error_type}\n\n상세: {error_msg}"
 
 
+@traced("get_env_var")
 def get_env_var(key: str, default: Optional[str] = None) -> Optional[str]:
     """환경변수 가져오기 (dotenv 사용)"""
     import os